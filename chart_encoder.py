@@ -0,0 +1,86 @@
+import os
+import io
+import time
+from PIL import Image
+
+# --- Konfiguration ---
+# Byte-Budget für einen Chart-Upload (Standard: 1 MB), per Umgebungsvariable überschreibbar
+CHART_MAX_BYTES = int(os.getenv("CHART_MAX_BYTES", 1_000_000))
+# "auto" probiert Palette-PNG und WebP, "png" bzw. "webp" erzwingen ein Format
+CHART_FORMAT = os.getenv("CHART_FORMAT", "auto").lower()
+if CHART_FORMAT not in ("auto", "png", "webp"):
+    CHART_FORMAT = "auto"
+
+# Auflösungen, die der Reihe nach probiert werden (höchste lesbare zuerst)
+DPI_STEPS = (200, 150, 120, 100, 80)
+PALETTE_COLORS = 64
+WEBP_QUALITIES = (85, 70)
+WEBP_MAX_DIM = 16383  # Maximale Kantenlänge, die WebP unterstützt
+
+MIME_TYPES = {"png": "image/png", "webp": "image/webp"}
+
+
+# --- Figure einmal pro Auflösung rendern ---
+def render_figure(fig, dpi):
+    raw = io.BytesIO()
+    # Nur minimal komprimieren, das PNG dient nur als Zwischenformat im Speicher
+    fig.savefig(raw, format="png", dpi=dpi, pil_kwargs={"compress_level": 1})
+    raw.seek(0)
+    img = Image.open(raw)
+    img.load()
+    return img.convert("RGB")
+
+
+# --- Kandidaten-Kodierungen ---
+def encode_palette_png(img):
+    buf = io.BytesIO()
+    # Charts bestehen aus wenigen Flächenfarben -> Palette ohne Dithering bleibt scharf
+    pal = img.quantize(colors=PALETTE_COLORS, method=Image.Quantize.FASTOCTREE,
+                       dither=Image.Dither.NONE)
+    pal.save(buf, format="PNG", optimize=True)
+    return buf.getvalue()
+
+
+def encode_webp(img, quality):
+    buf = io.BytesIO()
+    img.save(buf, format="WEBP", quality=quality, method=4)
+    return buf.getvalue()
+
+
+def candidate_encodings(img):
+    if CHART_FORMAT in ("auto", "png"):
+        yield "png", lambda: encode_palette_png(img)
+    if CHART_FORMAT in ("auto", "webp") and max(img.size) <= WEBP_MAX_DIM:
+        for quality in WEBP_QUALITIES:
+            yield "webp", lambda q=quality: encode_webp(img, q)
+
+
+# --- Hauptfunktion ---
+def encode_chart(fig, basename="chart", max_bytes=None):
+    """Kodiert eine Matplotlib-Figure im Speicher innerhalb des Byte-Budgets.
+
+    Gibt (Bytes, Dateiname, MIME-Typ) zurück. Passt nichts ins Budget,
+    wird die kleinste gefundene Variante verwendet.
+    """
+    max_bytes = max_bytes or CHART_MAX_BYTES
+    start = time.perf_counter()
+    best = None
+
+    for dpi in DPI_STEPS:
+        img = render_figure(fig, dpi)
+        for fmt, encode in candidate_encodings(img):
+            data = encode()
+            if best is None or len(data) < len(best[0]):
+                best = (data, fmt, dpi)
+            if len(data) <= max_bytes:
+                break
+        else:
+            continue
+        break
+
+    data, fmt, dpi = best
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    status = "✅" if len(data) <= max_bytes else "⚠️ über Budget"
+    print(f"🖼️ Chart kodiert: {fmt.upper()} @ {dpi} dpi, {len(data) / 1024:.0f} KB "
+          f"(Budget {max_bytes / 1024:.0f} KB) in {elapsed_ms:.0f} ms {status}")
+    return data, f"{basename}.{fmt}", MIME_TYPES[fmt]
@@ -7,6 +7,7 @@ import requests
 from datetime import datetime
 import pytz
 import yfinance as yf
+from chart_encoder import encode_chart
 
 # === Umgebungsvariablen ===
 DISCORD_WEBHOOK = os.getenv("DISCORD_WEBHOOK")
@@ -34,7 +35,7 @@ top5 = df.head(5)
 flop5 = df.tail(5).sort_values("change_pct")
 
 # Diagramm
-plt.figure(figsize=(8,5))
+fig = plt.figure(figsize=(8,5))
 combined = pd.concat([top5,flop5])
 colors = ["green" if x>0 else "red" for x in combined["change_pct"]]
 bars = plt.bar(combined["ticker"], combined["change_pct"], color=colors)
@@ -44,9 +45,8 @@ plt.grid(axis="y", linestyle="--", alpha=0.5)
 for bar,val in zip(bars,combined["change_pct"]):
     plt.text(bar.get_x()+bar.get_width()/2, val+(0.5 if val>=0 else -1), f"{val:+.2f}%", ha="center", va="bottom" if val>=0 else "top", fontsize=8)
 plt.tight_layout()
-chart_path = "top_flop_chart.png"
-plt.savefig(chart_path,dpi=300)
-plt.close()
+chart_bytes, chart_filename, _ = encode_chart(fig, basename="top_flop_chart")
+plt.close(fig)
 
 # Tabellen
 def format_table(df, title):
@@ -114,9 +114,8 @@ embed.add_embed_field(name="📉 Flop 5 Aktien", value=flop_table, inline=True)
 embed.add_embed_field(name="📈 Analyse", value=rise_section, inline=False)
 embed.add_embed_field(name="🤖 KI-Fazit", value=ki_fazit, inline=False)
 
-with open(chart_path, "rb") as f:
-    webhook.add_file(file=f.read(), filename="top_flop_chart.png")
-embed.set_image(url="attachment://top_flop_chart.png")
+webhook.add_file(file=chart_bytes, filename=chart_filename)
+embed.set_image(url=f"attachment://{chart_filename}")
 
 webhook.add_embed(embed)
 webhook.execute()
@@ -1,11 +1,11 @@
 import os
-import io
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.patches import Rectangle
 from matplotlib.colors import to_rgba
 from analyzer import analyze_and_predict_all
+from chart_encoder import encode_chart
 import requests
 
 WEBHOOK_URL = os.getenv("PROGNOSE_WEBHOOK")
@@ -101,7 +101,7 @@ def post_to_discord():
 
     message = build_discord_message(top_up, top_down)
     n = len(valid_assets)
-    fig, axes = plt.subplots(n, 1, figsize=(12, 4*n), constrained_layout=True, dpi=300)
+    fig, axes = plt.subplots(n, 1, figsize=(12, 4*n), constrained_layout=True)
 
     if n == 1:
         axes = [axes]
@@ -114,13 +114,11 @@ def post_to_discord():
             print(f"⚠️ Fehler bei Plot für {a['name']}: {e}")
             continue
 
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=300)
-    plt.close()
-    buf.seek(0)
+    image_bytes, filename, mime_type = encode_chart(fig, basename="top_assets")
+    plt.close(fig)
 
     payload = {"content": message}
-    files = [("file", ("top_assets.png", buf, "image/png"))]
+    files = [("file", (filename, image_bytes, mime_type))]
     response = requests.post(WEBHOOK_URL, data=payload, files=files)
 
     if response.status_code in (200, 204):